@@ -5,9 +5,1350 @@ import git
 from datetime import datetime
 from github import Github
 import json
+import copy
+import re
+import difflib
+import queue
 import webbrowser
+import subprocess
+import urllib.request
+import urllib.error
+import gzip
+import mmap
+import zlib
+import hashlib
+import tempfile
+import shutil
+import threading
+import time
+import logging
+import sys
+import signal
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # Fall back to zlib
+
+class RepoIndex:
+    """Persistent index of git repositories found under a set of root folders"""
+
+    SKIP_DIRS = {'node_modules', '__pycache__', 'venv', 'env', 'site-packages'}
+    # Upper bound on posting entries counted per search, keeps typeahead under ~10ms
+    SEARCH_BUDGET = 20000
+
+    def __init__(self, index_path):
+        self.index_path = os.path.abspath(index_path)
+        # Guards the reference swap between the worker and the UI thread
+        self.lock = threading.Lock()
+        # Serialises load and refresh, which can take seconds on big trees
+        self.refresh_lock = threading.Lock()
+        self.loaded = False
+        # dir path -> [mtime_ns, subdir names, is_repo]
+        self.dirs = {}
+        self.repos = []
+        self.names = []
+        self.lowered = []
+        self.trigrams = {}
+        self.short_grams = {}
+
+    def load(self):
+        """Load the index from disk, once; call from a worker thread"""
+        with self.refresh_lock:
+            if self.loaded:
+                return
+            self.loaded = True
+            try:
+                if os.path.exists(self.index_path):
+                    with gzip.open(self.index_path, 'rt', encoding='utf-8') as f:
+                        data = json.load(f)
+                    built = self._build(data.get('repos', []))
+                    with self.lock:
+                        self.dirs = data.get('dirs', {})
+                        self._swap(built)
+            except Exception as e:
+                print(f"Error loading repository index: {e}")
+                self.dirs = {}
+
+    def save(self):
+        """Write the index to disk as compressed JSON"""
+        try:
+            tmp_path = self.index_path + '.tmp'
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump({'dirs': self.dirs, 'repos': self.repos}, f, separators=(',', ':'))
+            os.replace(tmp_path, self.index_path)
+        except Exception as e:
+            print(f"Error saving repository index: {e}")
+
+    def refresh(self, roots):
+        """Rescan roots, only listing directories whose mtime has changed"""
+        self.load()
+        with self.refresh_lock:
+            dirs = {}
+            repos = []
+            stack = [os.path.abspath(r) for r in roots if os.path.isdir(r)]
+            while stack:
+                path = stack.pop()
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+
+                cached = self.dirs.get(path)
+                if cached and cached[0] == mtime:
+                    subdirs, is_repo = cached[1], cached[2]
+                else:
+                    subdirs, is_repo = [], False
+                    try:
+                        with os.scandir(path) as it:
+                            for entry in it:
+                                if entry.name == '.git':
+                                    is_repo = True
+                                elif (entry.is_dir(follow_symlinks=False)
+                                        and not entry.name.startswith('.')
+                                        and entry.name not in self.SKIP_DIRS):
+                                    subdirs.append(entry.name)
+                    except OSError:
+                        continue
+                    if is_repo:
+                        subdirs = []  # Don't descend into working trees
+
+                dirs[path] = [mtime, subdirs, is_repo]
+                if is_repo:
+                    repos.append(path)
+                stack.extend(os.path.join(path, name) for name in subdirs)
+
+            repos.sort()
+            # Build outside the lock so searches keep using the old index meanwhile
+            built = self._build(repos)
+            with self.lock:
+                self.dirs = dirs
+                self._swap(built)
+            self.save()
+            return len(repos)
+
+    @staticmethod
+    def _build(repos):
+        """Build the in-memory gram indexes used for matching"""
+        names = [os.path.basename(r).lower() for r in repos]
+        lowered = [r.lower().replace('\\', '/') for r in repos]
+        trigrams = {}
+        short_grams = {}
+        for i, path in enumerate(lowered):
+            # Index the last two path components, that's what people type
+            tail = '/'.join(path.rsplit('/', 2)[-2:])
+            for gram in {tail[j:j + 3] for j in range(len(tail) - 2)}:
+                trigrams.setdefault(gram, []).append(i)
+            # One and two character queries only match the repository name
+            name = names[i]
+            for gram in set(name) | {name[j:j + 2] for j in range(len(name) - 1)}:
+                short_grams.setdefault(gram, []).append(i)
+        return repos, names, lowered, trigrams, short_grams
+
+    def _swap(self, built):
+        self.repos, self.names, self.lowered, self.trigrams, self.short_grams = built
+
+    @staticmethod
+    def _subsequence_score(query, text, name_start):
+        """Score query as a subsequence of text, or return None if it isn't one"""
+        score = 0
+        pos = -1
+        for ch in query:
+            found = text.find(ch, pos + 1)
+            if found < 0:
+                return None
+            if found == pos + 1:
+                score += 3  # Consecutive characters
+            if found >= name_start:
+                score += 2  # Match inside the repository name
+            pos = found
+        return score - len(text) // 20
+
+    def search(self, query, limit=15):
+        """Return up to limit repository paths ranked by fuzzy match against query"""
+        query = query.strip().lower().replace('\\', '/')
+        if not query:
+            return []
+
+        with self.lock:
+            repos, names, lowered = self.repos, self.names, self.lowered
+            trigrams, short_grams = self.trigrams, self.short_grams
+
+        candidates = limit * 20
+        if len(query) < 3:
+            # Every hit matches equally well, so the first ones will do
+            top = [(i, 1) for i in short_grams.get(query, ())[:candidates]]
+        else:
+            # Rarest trigrams first; stop counting once the budget is spent,
+            # the subsequence check below re-ranks whatever made it in
+            postings = sorted((trigrams[g] for g in {query[j:j + 3] for j in range(len(query) - 2)}
+                               if g in trigrams), key=len)
+            hits = Counter()
+            spent = 0
+            for posting in postings:
+                if spent and spent + len(posting) > self.SEARCH_BUDGET:
+                    break
+                hits.update(posting)
+                spent += len(posting)
+            top = hits.most_common(candidates)
+
+        scored = []
+        for i, count in top:
+            text = lowered[i]
+            bonus = self._subsequence_score(query, text, len(text) - len(names[i]))
+            score = count * 10 + (bonus if bonus is not None else -50)
+            if names[i] == query:
+                score += 1000
+            scored.append((-score, text, repos[i]))
+        scored.sort()
+        return [path for _, _, path in scored[:limit]]
+
+def format_todo_items(high_priority, normal_priority, future_enhancements):
+    """Combine the three todo sections into the UPDATE_NOTES format"""
+    return f"""## High Priority
+{high_priority}
+
+## Normal Priority
+{normal_priority}
+
+## Future Enhancements
+{future_enhancements}"""
+
+def parse_markdown_sections(text):
+    """Split markdown into a dict of lowercased heading -> section body"""
+    sections = {}
+    heading = ''
+    lines = []
+    for line in text.splitlines():
+        if line.startswith('#'):
+            sections[heading] = '\n'.join(lines).strip()
+            heading = line.lstrip('#').strip().lower()
+            lines = []
+        else:
+            lines.append(line)
+    sections[heading] = '\n'.join(lines).strip()
+    return sections
+
+class DocWatchDaemon:
+    """Watch repositories for TODO/ISSUES/notes edits and run the update pipeline"""
+
+    NOTES_FILE = '.gitswift_notes.md'
+    WATCHED_FILES = ('TODO.md', 'ISSUES.md', NOTES_FILE)
+
+    def __init__(self, run_update, log=print, debounce=5.0, min_interval=300.0,
+                 max_workers=4, poll_interval=2.0):
+        self.run_update = run_update
+        self.log = log
+        self.debounce = debounce
+        self.min_interval = min_interval
+        self.poll_interval = poll_interval
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()
+        # repo path -> {'sig', 'changed_at', 'last_run', 'running'}
+        self.repos = {}
+        self.thread = None
+
+    def watch(self, repo_path):
+        """Start watching a repository"""
+        with self.lock:
+            if repo_path not in self.repos:
+                self.repos[repo_path] = {
+                    'sig': self._signature(repo_path),
+                    'changed_at': None,
+                    'last_run': 0.0,
+                    'running': False
+                }
+
+    def unwatch(self, repo_path):
+        """Stop watching a repository"""
+        with self.lock:
+            self.repos.pop(repo_path, None)
+
+    def start(self):
+        """Start the watcher thread"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._loop, daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        """Stop watching and wait for running updates to finish"""
+        self.stop_event.set()
+        self.executor.shutdown(wait=True)
+
+    def _signature(self, repo_path):
+        """Return (mtime, size) for each watched file"""
+        sig = []
+        for name in self.WATCHED_FILES:
+            try:
+                st = os.stat(os.path.join(repo_path, name))
+                sig.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                sig.append(None)
+        return tuple(sig)
+
+    def _loop(self):
+        # Sleep on the event so stop() wakes us immediately
+        while not self.stop_event.wait(self.poll_interval):
+            now = time.monotonic()
+            with self.lock:
+                for repo_path, state in self.repos.items():
+                    sig = self._signature(repo_path)
+                    if sig != state['sig']:
+                        # Every edit in a burst pushes the deadline back
+                        state['sig'] = sig
+                        state['changed_at'] = now
+
+                    if (state['changed_at'] is not None
+                            and not state['running']
+                            and now - state['changed_at'] >= self.debounce
+                            and now - state['last_run'] >= self.min_interval):
+                        state['running'] = True
+                        state['changed_at'] = None
+                        self.executor.submit(self._run, repo_path)
+
+    def _run(self, repo_path):
+        """Build update inputs from the watched files and run the pipeline"""
+        consumed = False
+        try:
+            notes_path = os.path.join(repo_path, self.NOTES_FILE)
+            update_desc = ''
+            notes_sig = None
+            if os.path.exists(notes_path):
+                st = os.stat(notes_path)
+                notes_sig = (st.st_mtime_ns, st.st_size)
+                with open(notes_path, 'r', encoding='utf-8') as f:
+                    update_desc = f.read().strip()
+            if not update_desc:
+                update_desc = "Updated TODO and known issues"
+
+            known_issues = ''
+            issues_path = os.path.join(repo_path, 'ISSUES.md')
+            if os.path.exists(issues_path):
+                with open(issues_path, 'r', encoding='utf-8') as f:
+                    known_issues = parse_markdown_sections(f.read()).get('current issues', '')
+
+            todo = {}
+            todo_path = os.path.join(repo_path, 'TODO.md')
+            if os.path.exists(todo_path):
+                with open(todo_path, 'r', encoding='utf-8') as f:
+                    todo = parse_markdown_sections(f.read())
+            todo_items = format_todo_items(
+                todo.get('high priority', ''),
+                todo.get('normal priority', ''),
+                todo.get('future enhancements', '')
+            )
+
+            self.run_update(repo_path, update_desc, known_issues, todo_items)
+
+            # Consume the notes so the next burst needs a new description, but
+            # only if nobody wrote to them while the update was running
+            try:
+                st = os.stat(notes_path)
+                if notes_sig == (st.st_mtime_ns, st.st_size):
+                    open(notes_path, 'w').close()
+                    consumed = True
+            except OSError:
+                pass
+            self.log(f"Updated {repo_path}")
+        except Exception as e:
+            self.log(f"Error updating {repo_path}: {e}")
+        finally:
+            with self.lock:
+                state = self.repos.get(repo_path)
+                if state:
+                    state['running'] = False
+                    state['last_run'] = time.monotonic()
+                    # Don't treat our own notes truncation as a new edit
+                    if consumed:
+                        state['sig'] = self._signature(repo_path)
+
+class MirrorCache:
+    """Cache of bare mirrors used to stamp docs through sparse throwaway worktrees"""
+
+    DOC_FILES = ('README.md', 'CHANGELOG.md', 'UPDATE_NOTES.md')
+
+    def __init__(self, cache_dir):
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def mirror(self, remote_url):
+        """Return a git command runner for an up-to-date bare mirror of remote_url"""
+        name = hashlib.sha1(remote_url.encode('utf-8')).hexdigest()[:16] + '.git'
+        path = os.path.join(self.cache_dir, name)
+        if not os.path.exists(path):
+            git.Repo.clone_from(remote_url, path, bare=True)
+            bare = git.Git(path)
+            # Keep branches as local heads so worktrees can check them out directly
+            bare.config('remote.origin.fetch', '+refs/heads/*:refs/heads/*')
+            # Keep core.bare per-worktree so sparse-checkout in the throwaway
+            # worktrees neither inherits it nor breaks the mirror
+            bare.config('core.repositoryformatversion', '1')
+            bare.config('extensions.worktreeConfig', 'true')
+            bare.config('--unset', 'core.bare')
+            bare.config('--worktree', 'core.bare', 'true')
+        # Plain command runner: GitPython doesn't read config.worktree
+        bare = git.Git(path)
+        bare.worktree('prune')
+        bare.fetch('origin', '--prune')
+        return bare
+
+    def stamp(self, remote_url, apply_update, branch=None):
+        """Check out only the doc files of branch, run apply_update(path) there and push"""
+        bare = self.mirror(remote_url)
+        if branch is None:
+            branch = bare.symbolic_ref('--short', 'HEAD')
+
+        worktree_path = tempfile.mkdtemp(prefix='worktree-', dir=self.cache_dir)
+        try:
+            bare.worktree('add', '--force', '--no-checkout', worktree_path, branch)
+            worktree = git.Repo(worktree_path)
+            worktree.git.sparse_checkout('set', '--no-cone', *self.DOC_FILES)
+            worktree.git.checkout()
+
+            result = apply_update(worktree_path)
+            worktree.git.push('origin', f'HEAD:refs/heads/{branch}')
+            return result
+        finally:
+            try:
+                bare.worktree('remove', '--force', worktree_path)
+            except git.exc.GitCommandError:
+                pass
+            bare.worktree('prune')
+
+def read_text(path):
+    """Return the contents of a text file, or None if it doesn't exist"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def render_readme(content, update_desc, current_date, repo_name):
+    """Return README.md content with the update added"""
+    if content is None:
+        content = f"# {repo_name}\n\n## Current Status\n🟢 Active Development\n"
+    if "### Latest Updates" not in content:
+        return content + f"\n### Latest Updates ({current_date})\n- {update_desc}\n"
+    # Insert new update at the top of the updates section
+    return content.replace("### Latest Updates", f"### Latest Updates ({current_date})\n- {update_desc}\n")
+
+def render_changelog(content, update_desc, current_date):
+    """Return CHANGELOG.md content with the update entry prepended"""
+    if content is None:
+        content = "# Changelog\n\n"
+    return f"## [{current_date}]\n### Added\n- {update_desc}\n\n{content}"
+
+def render_update_notes(update_desc, known_issues, todo_items, current_date):
+    """Return UPDATE_NOTES.md content for an update"""
+    return f"""# Update Notes ({current_date})
+
+## Changes Made
+- {update_desc}
+
+## Known Issues
+{known_issues if known_issues else '- [ ] No known issues reported'}
+
+## Todo
+{todo_items if todo_items else '- [ ] No todo items added'}
+
+## Testing Notes
+- [ ] Add testing requirements/results
+
+## Dependencies
+- List any new dependencies added
+
+## Migration Steps
+1. Pull latest changes
+2. [Add any necessary migration steps]
+
+## Rollback Plan
+1. [Document how to rollback these changes if needed]
+"""
+
+def _common_prefix_length(a, b, step=65536):
+    """Length of the common prefix of two strings using C-level slice compares"""
+    limit = min(len(a), len(b))
+    lo = 0
+    while lo + step <= limit and a[lo:lo + step] == b[lo:lo + step]:
+        lo += step
+    hi = min(lo + step, limit)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+def fast_unified_diff(old, new, name, context=3):
+    """Unified diff that skips the common head and tail before calling difflib"""
+    # Prepending to a multi-MB changelog leaves everything after the entry unchanged,
+    # so only split and diff the region that actually differs
+    head = _common_prefix_length(old, new)
+    tail = _common_prefix_length(old[head:][::-1], new[head:][::-1])
+
+    # Snap to line boundaries and widen by the context lines
+    start = old.rfind('\n', 0, head) + 1
+    for _ in range(context):
+        if start == 0:
+            break
+        start = old.rfind('\n', 0, start - 1) + 1
+    old_end = len(old) - tail
+    new_end = len(new) - tail
+    for _ in range(context + 1):
+        next_end = old.find('\n', old_end)
+        if next_end < 0:
+            old_end, new_end = len(old), len(new)
+            break
+        new_end += next_end + 1 - old_end
+        old_end = next_end + 1
+
+    diff = difflib.unified_diff(
+        old[start:old_end].splitlines(keepends=True),
+        new[start:new_end].splitlines(keepends=True),
+        fromfile=f'a/{name}',
+        tofile=f'b/{name}',
+        n=context
+    )
+    offset = old.count('\n', 0, start)
+
+    def shift(match):
+        old_start, old_len, new_start, new_len = match.groups()
+        return (f"@@ -{int(old_start) + offset}{old_len or ''} "
+                f"+{int(new_start) + offset}{new_len or ''} @@")
+
+    return ''.join(re.sub(r'^@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@', shift, line) for line in diff)
+
+def sha256_file(path, chunk_size=8 * 1024 * 1024):
+    """SHA-256 of a file, streamed through a memory map"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return digest.hexdigest()  # Empty files can't be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                # hashlib releases the GIL on large buffers, so threads hash in parallel
+                for offset in range(0, size, chunk_size):
+                    digest.update(view[offset:offset + chunk_size])
+    return digest.hexdigest()
+
+def hash_artifacts(artifacts_dir, max_workers=None, exclude=()):
+    """Return {relative path: sha256} for every file under artifacts_dir"""
+    paths = []
+    for dirpath, _, filenames in os.walk(artifacts_dir):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            if os.path.abspath(path) not in exclude:
+                paths.append(path)
+    # Start the biggest files first so one large artifact doesn't finish last
+    paths.sort(key=os.path.getsize, reverse=True)
+
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        digests = executor.map(sha256_file, paths)
+        return {
+            os.path.relpath(path, artifacts_dir).replace(os.sep, '/'): digest
+            for path, digest in zip(paths, digests)
+        }
+
+def latest_changelog_entry(content):
+    """Return the first entry of a CHANGELOG"""
+    lines = content.splitlines()
+    entry = []
+    for line in lines:
+        if entry and line.startswith(('# ', '## ')):
+            break
+        if line.startswith('## ') or entry:
+            entry.append(line)
+    return '\n'.join(entry).strip()
+
+def owner_repo_from_url(remote_url):
+    """Extract owner/name from a GitHub remote URL"""
+    return remote_url.split('.git')[0].split('github.com/')[-1].split('github.com:')[-1]
+
+# GitHub rejects issue bodies and comments over 65536 characters; counting
+# UTF-8 bytes keeps us under it for any text
+ISSUE_BODY_LIMIT = 65536
+
+class IssueBodyBuilder:
+    """Build an issue body up to a byte budget, spilling the rest into comments"""
+
+    CONTINUED_NOTE = "\n\n*Continued in the comments below.*\n"
+
+    def __init__(self, footer='', budget=ISSUE_BODY_LIMIT):
+        self.budget = budget
+        self.footer = footer
+        self.parts = []
+        self.overflow = []
+        # Reserve room for the footer and the continuation note up front
+        self.remaining = budget - len(footer.encode('utf-8')) - len(self.CONTINUED_NOTE.encode('utf-8'))
+
+    def add(self, text):
+        """Append text to the body, or to the overflow once the budget is spent"""
+        if self.overflow:
+            self.overflow.append(text)
+            return
+        data = text.encode('utf-8')
+        if len(data) <= self.remaining:
+            self.parts.append(text)
+            self.remaining -= len(data)
+            return
+        cut = self._cut(data, 0, self.remaining)
+        self.parts.append(data[:cut].decode('utf-8'))
+        self.overflow.append(data[cut:].decode('utf-8'))
+        self.remaining = 0
+
+    @staticmethod
+    def _cut(data, start, limit):
+        """Last safe split point in data[start:start + limit], preferring a line end"""
+        end = start + limit
+        if end >= len(data):
+            return len(data)
+        newline = data.rfind(b'\n', start, end)
+        if newline >= start and newline > start + limit // 2:
+            return newline + 1
+        # Don't split a multi-byte character
+        while end > start and (data[end] & 0xC0) == 0x80:
+            end -= 1
+        return end
+
+    def body(self):
+        """Return the issue body"""
+        note = self.CONTINUED_NOTE if self.overflow else ''
+        return ''.join(self.parts) + note + self.footer
+
+    def comments(self):
+        """Return the overflow split into comments that each fit the budget"""
+        if not self.overflow:
+            return []
+        data = ''.join(self.overflow).encode('utf-8')
+        header_room = 64  # For the "(continued i/n)" header
+        chunks = []
+        pos = 0
+        while pos < len(data):
+            cut = self._cut(data, pos, self.budget - header_room)
+            chunks.append(data[pos:cut].decode('utf-8'))
+            pos = cut
+        return [f"*(continued {i}/{len(chunks)})*\n\n{chunk}" for i, chunk in enumerate(chunks, 1)]
+
+def build_issue(update_desc, known_issues, high_priority, normal_priority, future_enhancements, current_date,
+                budget=ISSUE_BODY_LIMIT):
+    """Build the title, body, overflow comments and labels of the GitHub issue for an update"""
+    # Create a more descriptive title from the description
+    title = f"Update ({current_date}): {update_desc[:50]}..." if len(update_desc) > 50 else f"Update ({current_date}): {update_desc}"
+
+    # Build the issue body with conditional sections, stopping at the size limit
+    builder = IssueBodyBuilder(footer="""
+---
+*This issue was automatically created by the Repository Update Tool*""", budget=budget)
+    builder.add(f"""# Repository Update - {current_date}
+
+## Description
+{update_desc}
+""")
+
+    # Only add Known Issues section if there are any
+    if known_issues.strip():
+        builder.add(f"""
+## Known Issues
+{known_issues}
+""")
+
+    # Add Todo sections only if they contain content
+    if any([high_priority, normal_priority, future_enhancements]):
+        builder.add("\n## Todo Items")
+        
+        if high_priority:
+            builder.add(f"""
+### 🔴 High Priority
+{high_priority}
+""")
+
+        if normal_priority:
+            builder.add(f"""
+### 🟡 Normal Priority
+{normal_priority}
+""")
+
+        if future_enhancements:
+            builder.add(f"""
+### 🔵 Future Enhancements
+{future_enhancements}
+""")
+
+    # Determine labels based on content
+    labels = ['update']
+    if known_issues.strip():
+        labels.append('has-issues')
+    if high_priority:
+        labels.append('high-priority')
+    if future_enhancements:
+        labels.append('enhancement')
+
+    return title, builder.body(), builder.comments(), labels
+
+class GitHubReadCache:
+    """GitHub reads with an on-disk ETag cache and batched GraphQL lookups"""
+
+    def __init__(self, token, cache_dir, api_url='https://api.github.com'):
+        self.token = token
+        self.api_url = api_url.rstrip('/')
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _request(self, url, data=None, headers=None):
+        request = urllib.request.Request(url, data=data, headers={
+            'Authorization': f'token {self.token}',
+            'Accept': 'application/vnd.github+json',
+            **(headers or {})
+        })
+        return urllib.request.urlopen(request, timeout=30)
+
+    def get(self, path):
+        """GET a REST resource, revalidating the cached copy with If-None-Match"""
+        url = self.api_url + path
+        cache_path = os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+        cached = None
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    cached = json.load(f)
+            except (OSError, ValueError):
+                cached = None
+
+        headers = {'If-None-Match': cached['etag']} if cached else {}
+        try:
+            with self._request(url, headers=headers) as response:
+                body = json.loads(response.read().decode('utf-8'))
+                etag = response.headers.get('ETag')
+        except urllib.error.HTTPError as e:
+            # 304 Not Modified doesn't count against the rate limit
+            if e.code == 304 and cached:
+                return cached['body']
+            raise
+
+        if etag:
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'etag': etag, 'body': body}, f)
+        return body
+
+    def graphql(self, query, variables=None):
+        """Run a GraphQL query and return (data, {top-level alias: error message})
+
+        A missing repository only fails its own alias and the rest of the
+        data still comes back, so errors are reported per alias.
+        """
+        payload = json.dumps({'query': query, 'variables': variables or {}}).encode('utf-8')
+        with self._request(self.api_url + '/graphql', data=payload,
+                           headers={'Content-Type': 'application/json'}) as response:
+            result = json.loads(response.read().decode('utf-8'))
+        errors = {}
+        for error in result.get('errors') or []:
+            alias = (error.get('path') or [None])[0]
+            errors.setdefault(alias, error.get('message', 'unknown error'))
+        if result.get('data') is None or None in errors:
+            message = errors.get(None) or next(iter(errors.values()), 'no data returned')
+            raise ValueError(f"GraphQL error: {message}")
+        return result['data'], errors
+
+    def find_open_issue(self, owner_repo, title_prefix):
+        """Return the first open issue whose title starts with title_prefix, or None"""
+        issues = self.get(f'/repos/{owner_repo}/issues?state=open&per_page=100')
+        for issue in issues:
+            if 'pull_request' not in issue and issue['title'].startswith(title_prefix):
+                return issue
+        return None
+
+    def lookup_repos(self, owner_repos, title_prefix):
+        """Fetch default branch, labels and a matching open issue for many repos in one query"""
+        params = []
+        fields = []
+        variables = {}
+        for i, owner_repo in enumerate(owner_repos):
+            owner, name = owner_repo.split('/', 1)
+            params.append(f'$o{i}: String!, $n{i}: String!, $q{i}: String!')
+            fields.append(f"""
+  r{i}: repository(owner: $o{i}, name: $n{i}) {{
+    defaultBranchRef {{ name }}
+    labels(first: 100) {{ nodes {{ name }} }}
+  }}
+  s{i}: search(query: $q{i}, type: ISSUE, first: 10) {{
+    nodes {{ ... on Issue {{ number title labels(first: 20) {{ nodes {{ name }} }} }} }}
+  }}""")
+            variables[f'o{i}'] = owner
+            variables[f'n{i}'] = name
+            variables[f'q{i}'] = f'repo:{owner_repo} is:issue is:open in:title "{title_prefix}"'
+
+        if not owner_repos:
+            return {}
+        data, errors = self.graphql(f"query({', '.join(params)}) {{{''.join(fields)}\n}}", variables)
+
+        results = {}
+        for i, owner_repo in enumerate(owner_repos):
+            error = errors.get(f'r{i}') or errors.get(f's{i}')
+            if error:
+                results[owner_repo] = {'error': error}
+                continue
+            repo = data.get(f'r{i}') or {}
+            matches = [n for n in (data.get(f's{i}') or {}).get('nodes', [])
+                       if n and n['title'].startswith(title_prefix)]
+            existing = None
+            if matches:
+                existing = {
+                    'number': matches[0]['number'],
+                    'title': matches[0]['title'],
+                    'labels': [{'name': l['name']} for l in matches[0]['labels']['nodes']]
+                }
+            results[owner_repo] = {
+                'error': None,
+                'default_branch': (repo.get('defaultBranchRef') or {}).get('name'),
+                'labels': [l['name'] for l in (repo.get('labels') or {}).get('nodes', [])],
+                'existing_issue': existing
+            }
+        return results
+
+class HistoryStore:
+    """Content-addressed store of doc files as they were before each update"""
+
+    TRACKED_FILES = ['README.md', 'CHANGELOG.md', 'UPDATE_NOTES.md', 'SHA256SUMS']
+
+    def __init__(self, store_dir):
+        self.store_dir = store_dir
+        self.objects_dir = os.path.join(store_dir, 'objects')
+        self.snapshots_dir = os.path.join(store_dir, 'snapshots')
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.snapshots_dir, exist_ok=True)
+
+    @classmethod
+    def for_repo(cls, repo_path):
+        """Return the store kept inside the repository's git directory"""
+        repo = git.Repo(repo_path)
+        return cls(os.path.join(repo.git_dir, 'gitswift', 'history'))
+
+    @staticmethod
+    def _chunks(data):
+        """Split data at content-defined line boundaries so unchanged runs dedupe"""
+        chunks = []
+        start = 0
+        pos = 0
+        while pos < len(data):
+            end = data.find(b'\n', pos)
+            end = len(data) if end < 0 else end + 1
+            # Boundaries depend only on line content, so a prepended entry
+            # doesn't shift the chunks that follow it
+            if zlib.crc32(data[pos:end]) & 0x1f == 0 or end - start >= 65536:
+                chunks.append(data[start:end])
+                start = end
+            pos = end
+        if start < len(data):
+            chunks.append(data[start:])
+        return chunks
+
+    def _put(self, chunk):
+        digest = hashlib.sha256(chunk).hexdigest()
+        path = os.path.join(self.objects_dir, digest[:2], digest[2:])
+        if not os.path.exists(path):
+            if zstandard is not None:
+                packed = b's' + zstandard.ZstdCompressor().compress(chunk)
+            else:
+                packed = b'z' + zlib.compress(chunk, 9)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path + '.tmp', 'wb') as f:
+                f.write(packed)
+            os.replace(path + '.tmp', path)
+        return digest
+
+    def _put_tree(self, data):
+        """Store data and return (depth, root digest) of its chunk tree"""
+        level = [self._put(chunk) for chunk in self._chunks(data)] or [self._put(b'')]
+        depth = 0
+        # Group digests into content-defined lists too, so a snapshot of a big
+        # file only adds the few lists on the path to the changed chunks
+        while len(level) > 1:
+            groups = [[]]
+            for digest in level:
+                groups[-1].append(digest)
+                if int(digest[-2:], 16) & 0x0f == 0 or len(groups[-1]) >= 256:
+                    groups.append([])
+            level = [self._put('\n'.join(g).encode('ascii')) for g in groups if g]
+            depth += 1
+        return depth, level[0]
+
+    def _get_tree(self, depth, digest):
+        """Yield the chunks of a tree stored by _put_tree"""
+        if depth == 0:
+            yield self._get(digest)
+            return
+        for child in self._get(digest).decode('ascii').split('\n'):
+            yield from self._get_tree(depth - 1, child)
+
+    def _get(self, digest):
+        with open(os.path.join(self.objects_dir, digest[:2], digest[2:]), 'rb') as f:
+            packed = f.read()
+        if packed[:1] == b's':
+            if zstandard is None:
+                raise RuntimeError("zstandard is required to read this snapshot")
+            return zstandard.ZstdDecompressor().decompress(packed[1:])
+        return zlib.decompress(packed[1:])
+
+    def snapshot(self, repo_path, note=''):
+        """Store the current tracked files and return the snapshot record"""
+        files = {}
+        for name in self.TRACKED_FILES:
+            path = os.path.join(repo_path, name)
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    files[name] = self._put_tree(f.read())
+            else:
+                files[name] = None
+
+        snapshot = {
+            'id': datetime.now().strftime("%Y%m%d%H%M%S%f"),
+            'note': note,
+            'files': files,
+            'commit': None,
+            'tag': None,
+            'undone': False
+        }
+        self._write(snapshot)
+        return snapshot
+
+    def _write(self, snapshot):
+        with open(os.path.join(self.snapshots_dir, snapshot['id'] + '.json'), 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f)
+
+    def discard(self, snapshot):
+        """Forget a snapshot whose update was rolled back before committing"""
+        try:
+            os.remove(os.path.join(self.snapshots_dir, snapshot['id'] + '.json'))
+        except OSError:
+            pass
+
+    def record_commit(self, snapshot, hexsha, tag=None):
+        """Remember the update commit (and release tag) made on top of a snapshot"""
+        snapshot['commit'] = hexsha
+        snapshot['tag'] = tag
+        self._write(snapshot)
+
+    def latest(self):
+        """Return the newest snapshot that hasn't been undone, or None"""
+        for name in sorted(os.listdir(self.snapshots_dir), reverse=True):
+            with open(os.path.join(self.snapshots_dir, name), 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            if not snapshot['undone'] and snapshot['commit']:
+                return snapshot
+        return None
+
+    def restore(self, snapshot, repo_path):
+        """Write the snapshot's files back into the working tree"""
+        for name, tree in snapshot['files'].items():
+            path = os.path.join(repo_path, name)
+            if tree is None:
+                if os.path.exists(path):
+                    os.remove(path)
+                continue
+            with open(path, 'wb') as f:
+                for chunk in self._get_tree(*tree):
+                    f.write(chunk)
+
+    def undo(self, repo_path, mode='revert'):
+        """Restore the files from before the last update
+
+        mode 'files' only restores the files, 'revert' also commits them and
+        'drop' removes the update commit when it's still HEAD.
+        """
+        snapshot = self.latest()
+        if snapshot is None:
+            raise ValueError("No update to undo")
+
+        repo = git.Repo(repo_path)
+        if mode == 'drop' and repo.head.commit.hexsha != snapshot['commit']:
+            raise ValueError("The update commit is no longer HEAD, use revert instead")
+        if mode == 'drop' and not repo.head.commit.parents:
+            mode = 'revert'  # Nothing to reset to
+
+        self.restore(snapshot, repo_path)
+        if mode != 'files':
+            present = [n for n, t in snapshot['files'].items() if t is not None]
+            removed = [n for n, t in snapshot['files'].items()
+                       if t is None and (n, 0) in repo.index.entries]
+            if mode == 'drop':
+                repo.head.reset(repo.head.commit.parents[0], index=False, working_tree=False)
+            if present:
+                repo.index.add(present)
+            if removed:
+                repo.index.remove(removed)
+            if mode == 'revert':
+                repo.index.commit(f"revert: undo update {snapshot['commit'][:7]}\n\n{snapshot['note']}")
+
+        # With 'files' the update commit stays in history, and so does its tag
+        if mode != 'files' and snapshot.get('tag') and snapshot['tag'] in repo.tags:
+            repo.delete_tag(snapshot['tag'])
+
+        snapshot['undone'] = True
+        self._write(snapshot)
+        return snapshot
+
+class HookFailedError(Exception):
+    """Raised when a pre-commit hook fails or times out"""
+
+class HookRunner:
+    """Run configured hook commands in parallel, caching passes by git tree hash
+
+    Hooks run in a throwaway worktree of the tree being checked, so unstaged
+    edits in the user's working tree can't make a bad tree pass.
+    """
+
+    def __init__(self, hooks, cache_path, max_workers=4):
+        self.hooks = hooks
+        self.cache_path = cache_path
+        self.max_workers = max_workers
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self, cache):
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+
+    @staticmethod
+    def _hook_key(hook):
+        return hashlib.sha1(json.dumps([hook.get('name'), hook['command']]).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _kill_group(process):
+        """Kill a hook's shell and everything it started"""
+        try:
+            if os.name == 'nt':
+                subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)], capture_output=True)
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            pass
+        process.kill()
+
+    def _run_hook(self, hook, repo_path, tree_sha):
+        """Run one hook command, returning its result record"""
+        started = time.perf_counter()
+        timeout = hook.get('timeout', 300)
+        # Own process group, so a timeout can take down the shell's children too
+        if os.name == 'nt':
+            group = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            group = {'start_new_session': True}
+        process = subprocess.Popen(
+            hook['command'],
+            shell=True,
+            cwd=repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            env={**os.environ, 'GITSWIFT_TREE': tree_sha},
+            **group
+        )
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+            ok = process.returncode == 0
+            output = (stdout + stderr).strip()
+        except subprocess.TimeoutExpired:
+            self._kill_group(process)
+            try:
+                # Don't wait on pipes held open by anything that escaped the group
+                process.communicate(timeout=5)
+            except subprocess.TimeoutExpired:
+                pass
+            ok = False
+            output = f"timed out after {timeout}s"
+        return {
+            'name': hook.get('name', hook['command']),
+            'ok': ok,
+            'seconds': time.perf_counter() - started,
+            'cached': False,
+            'output': output[-2000:]
+        }
+
+    @staticmethod
+    def source_key(repo, tree_sha, exclude):
+        """Hash of tree_sha's top-level entries except the names in exclude"""
+        entries = [line for line in repo.git.ls_tree(tree_sha).splitlines()
+                   if line.split('\t', 1)[1] not in exclude]
+        return hashlib.sha1('\n'.join(entries).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _checkout(repo_path, tree_sha):
+        """Check tree_sha out into a detached throwaway worktree and return its path"""
+        repo = git.Repo(repo_path)
+        parents = [repo.head.commit] if repo.head.is_valid() else []
+        # Worktrees need a commit; this one is never referenced and gets gc'd
+        commit = git.Commit.create_from_tree(repo, repo.tree(tree_sha), 'gitswift hook check',
+                                             parent_commits=parents, head=False)
+        path = tempfile.mkdtemp(prefix='gitswift-hooks-')
+        repo.git.worktree('add', '--detach', path, commit.hexsha)
+        return path
+
+    @staticmethod
+    def _remove_checkout(repo_path, path):
+        repo = git.Repo(repo_path)
+        try:
+            repo.git.worktree('remove', '--force', path)
+        except git.exc.GitCommandError:
+            pass
+        shutil.rmtree(path, ignore_errors=True)
+        repo.git.worktree('prune')
+
+    def run(self, repo_path, tree_sha, cache_key=None, on_progress=None):
+        """Run every hook against tree_sha and return their results in config order
+
+        Passes are remembered under cache_key, which defaults to tree_sha.
+        on_progress gets the finished results each time a hook completes.
+        """
+        if cache_key is None:
+            cache_key = tree_sha
+        cache = self._load_cache()
+        passed = cache.get(cache_key, {})
+        results = [None] * len(self.hooks)
+        pending = []
+        for i, hook in enumerate(self.hooks):
+            if self._hook_key(hook) in passed:
+                results[i] = {
+                    'name': hook.get('name', hook['command']),
+                    'ok': True,
+                    'seconds': 0.0,
+                    'cached': True,
+                    'output': ''
+                }
+            else:
+                pending.append(i)
+
+        if pending:
+            checkout = self._checkout(repo_path, tree_sha)
+            try:
+                # Each hook is its own process; threads just wait on them
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = {executor.submit(self._run_hook, self.hooks[i], checkout, tree_sha): i for i in pending}
+                    for future in as_completed(futures):
+                        results[futures[future]] = future.result()
+                        if on_progress:
+                            on_progress([r for r in results if r])
+            finally:
+                self._remove_checkout(repo_path, checkout)
+
+            # Only remember passes; failures may be flaky and should run again
+            for i in pending:
+                if results[i]['ok']:
+                    passed[self._hook_key(self.hooks[i])] = results[i]['seconds']
+            cache.pop(cache_key, None)
+            cache[cache_key] = passed
+            while len(cache) > 50:
+                cache.pop(next(iter(cache)))
+            self._save_cache(cache)
+        return results
+
+    @staticmethod
+    def summary(results):
+        """Format per-hook timings for the status bar"""
+        parts = []
+        for result in results:
+            if result['cached']:
+                parts.append(f"{result['name']} cached")
+            else:
+                parts.append(f"{result['name']} {result['seconds']:.1f}s {'✓' if result['ok'] else '✗'}")
+        return "Hooks: " + ", ".join(parts)
+
+class DocUpdater:
+    """Configuration and the doc update pipeline, without any Tk widgets"""
+
+    # config key -> (attribute, default)
+    CONFIG_FIELDS = {
+        'github_token': ('github_token', ''),
+        'recent_repos': ('recent_repos', []),
+        'index_roots': ('index_roots', []),
+        'watch_repos': ('watch_repos', []),
+        'watch_settings': ('watch_settings', {}),
+        'bulk_remotes': ('bulk_remotes', []),
+        'mirror_cache_dir': ('mirror_cache_dir', '~/.gitswift/mirrors'),
+        'github_api_url': ('github_api_url', 'https://api.github.com'),
+        'github_cache_dir': ('github_cache_dir', '~/.gitswift/http_cache'),
+        'hooks': ('hooks', []),
+        'hook_workers': ('hook_workers', 4),
+        'release': ('release_settings', {})
+    }
+
+    def load_config(self):
+        """Load configuration including recent repositories and GitHub token"""
+        config = {}
+        try:
+            if os.path.exists('repo_config.json'):
+                with open('repo_config.json', 'r') as f:
+                    config = json.load(f)
+        except Exception as e:
+            print(f"Error loading config: {e}")
+        for key, (attr, default) in self.CONFIG_FIELDS.items():
+            setattr(self, attr, config.get(key, copy.deepcopy(default)))
+
+    def save_config(self):
+        """Save configuration including recent repositories and GitHub token"""
+        try:
+            config = {key: getattr(self, attr) for key, (attr, _) in self.CONFIG_FIELDS.items()}
+            with open('repo_config.json', 'w') as f:
+                json.dump(config, f)
+        except Exception as e:
+            print(f"Error saving config: {e}")
+
+    def make_watch_daemon(self, log):
+        """Return a DocWatchDaemon that runs updates with the configured watch settings"""
+        return DocWatchDaemon(
+            self.commit_doc_update,
+            log=log,
+            debounce=self.watch_settings.get('debounce', 5.0),
+            min_interval=self.watch_settings.get('min_interval', 300.0),
+            max_workers=self.watch_settings.get('max_workers', 4),
+            poll_interval=self.watch_settings.get('poll_interval', 2.0)
+        )
 
-class RepoUpdateGUI:
+    def commit_doc_update(self, repo_path, update_desc, known_issues, todo_items, current_date=None,
+                          on_hooks=None, release=False, on_release=None, run_hooks=True):
+        """Write README, CHANGELOG and UPDATE_NOTES for an update and commit them
+
+        Pass run_hooks=False where the checkout is incomplete, like the
+        sparse worktrees used for bulk stamping, since hooks would fail there.
+        """
+        if current_date is None:
+            current_date = datetime.now().strftime("%Y-%m-%d")
+
+        # Hash release artifacts first so a missing dist/ fails before any doc is touched
+        sums = self.compute_checksums(repo_path) if release else None
+
+        # Keep the pre-update files so the update can be undone
+        history = HistoryStore.for_repo(repo_path)
+        snapshot = history.snapshot(repo_path, update_desc)
+
+        doc_files = ['README.md', 'CHANGELOG.md', 'UPDATE_NOTES.md']
+        if release:
+            doc_files.append('SHA256SUMS')
+
+        repo = git.Repo(repo_path)
+        try:
+            # Update README.md
+            self.update_readme(update_desc, current_date, repo_path)
+
+            # Update CHANGELOG.md
+            self.update_changelog(update_desc, current_date, repo_path)
+
+            # Create UPDATE_NOTES.md
+            self.create_update_notes(update_desc, known_issues, todo_items, current_date, repo_path)
+
+            # Checksum release artifacts into the same commit
+            if release:
+                self.write_checksums(repo_path, sums)
+
+            # Git operations
+            repo.index.add(doc_files)
+
+            # Run hooks against exactly what is about to be committed
+            if self.hooks and run_hooks:
+                tree_sha = repo.index.write_tree().hexsha
+                # Every update rewrites the docs, so key passes on the rest of
+                # the tree or unchanged sources would never hit the cache; a
+                # hook that only checks the docs isn't rerun on a hit
+                hook_key = HookRunner.source_key(repo, tree_sha, doc_files)
+                runner = HookRunner(
+                    self.hooks,
+                    os.path.join(repo.git_dir, 'gitswift', 'hook_cache.json'),
+                    self.hook_workers
+                )
+                results = runner.run(repo_path, tree_sha, hook_key, on_progress=on_hooks)
+                if on_hooks:
+                    on_hooks(results)
+                failed = [r for r in results if not r['ok']]
+                if failed:
+                    details = "\n\n".join(f"{r['name']}:\n{r['output']}" for r in failed)
+                    raise HookFailedError(f"{HookRunner.summary(results)}\n\n{details}")
+
+            commit_message = f"update({current_date}): {update_desc}\n\n- Updated documentation\n- Added changelog entry\n- Created update notes"
+            commit = repo.index.commit(commit_message)
+        except Exception:
+            # Put the docs and the index back the way they were
+            history.restore(snapshot, repo_path)
+            history.discard(snapshot)
+            if repo.head.is_valid():
+                repo.git.reset('-q', 'HEAD', '--', *doc_files)
+            else:
+                repo.git.rm('-q', '--cached', '--ignore-unmatch', *doc_files)
+            raise
+
+        # Record the commit before tagging so Undo finds it even if tagging fails
+        history.record_commit(snapshot, commit.hexsha)
+        if release:
+            tag = self.tag_release(repo, commit, current_date, repo_path)
+            history.record_commit(snapshot, commit.hexsha, tag)
+            if on_release:
+                on_release(tag)
+        return commit
+
+    def compute_checksums(self, repo_path):
+        """Return {path relative to repo_path: sha256} for the configured artifacts directory"""
+        artifacts_dir = os.path.join(repo_path, self.release_settings.get('artifacts_dir', 'dist'))
+        if not os.path.isdir(artifacts_dir):
+            raise ValueError(f"Artifacts directory not found: {artifacts_dir}")
+
+        sums = hash_artifacts(
+            artifacts_dir,
+            max_workers=self.release_settings.get('hash_workers'),
+            exclude={os.path.abspath(os.path.join(repo_path, 'SHA256SUMS'))}
+        )
+        # SHA256SUMS lives at the repo root, so `sha256sum -c` must work from there
+        prefix = os.path.relpath(artifacts_dir, repo_path).replace(os.sep, '/')
+        if prefix == '.':
+            return sums
+        return {f"{prefix}/{name}": digest for name, digest in sums.items()}
+
+    def write_checksums(self, repo_path, sums):
+        """Write SHA256SUMS from compute_checksums output"""
+        with open(os.path.join(repo_path, 'SHA256SUMS'), 'w', encoding='utf-8', newline='\n') as f:
+            for name in sorted(sums):
+                f.write(f"{sums[name]}  {name}\n")
+
+    def tag_release(self, repo, commit, current_date, repo_path):
+        """Create an annotated tag for the update from its CHANGELOG entry"""
+        base = self.release_settings.get('tag_prefix', 'v') + current_date
+        name = base
+        suffix = 2
+        while name in repo.tags:
+            name = f"{base}.{suffix}"
+            suffix += 1
+
+        entry = latest_changelog_entry(read_text(os.path.join(repo_path, 'CHANGELOG.md')) or '')
+        # Verbatim cleanup, otherwise git drops the markdown headings as comments
+        repo.create_tag(name, ref=commit, message=entry or f"Release {name}", cleanup='verbatim')
+        return name
+
+    def update_readme(self, update_desc, current_date, repo_path='.'):
+        readme_path = os.path.join(repo_path, 'README.md')
+        content = read_text(readme_path)
+        with open(readme_path, 'w', encoding='utf-8') as f:
+            f.write(render_readme(content, update_desc, current_date, os.path.basename(os.path.abspath(repo_path))))
+
+    def update_changelog(self, update_desc, current_date, repo_path='.'):
+        changelog_path = os.path.join(repo_path, 'CHANGELOG.md')
+        content = read_text(changelog_path)
+        with open(changelog_path, 'w', encoding='utf-8') as f:
+            f.write(render_changelog(content, update_desc, current_date))
+
+    def create_update_notes(self, update_desc, known_issues, todo_items, current_date, repo_path='.'):
+        with open(os.path.join(repo_path, 'UPDATE_NOTES.md'), 'w', encoding='utf-8') as f:
+            f.write(render_update_notes(update_desc, known_issues, todo_items, current_date))
+
+class RepoUpdateGUI(DocUpdater):
     def __init__(self, root):
         self.root = root
         self.root.title("GitSwift Update Tool")
@@ -152,35 +1493,22 @@ class RepoUpdateGUI:
         # Load saved repositories and GitHub token
         self.load_config()
         
+        self.repo_index = RepoIndex('repo_index.json.gz')
+        self.index_search_job = None
+        self.watch_daemon = None
+        self.update_running = False
+        self.preview_window = None
+        self.preview_job = None
+        self.preview_key = None
+        self.preview_cache = {}
+        self.file_cache = {}
+        self.preview_queue = queue.Queue()
+        threading.Thread(target=self.preview_worker, daemon=True).start()
+        
         self.create_widgets()
-
-    def load_config(self):
-        """Load configuration including recent repositories and GitHub token"""
-        try:
-            if os.path.exists('repo_config.json'):
-                with open('repo_config.json', 'r') as f:
-                    config = json.load(f)
-                    self.github_token = config.get('github_token', '')
-                    self.recent_repos = config.get('recent_repos', [])
-            else:
-                self.github_token = ''
-                self.recent_repos = []
-        except Exception as e:
-            print(f"Error loading config: {e}")
-            self.github_token = ''
-            self.recent_repos = []
-
-    def save_config(self):
-        """Save configuration including recent repositories and GitHub token"""
-        try:
-            config = {
-                'github_token': self.github_token,
-                'recent_repos': self.recent_repos
-            }
-            with open('repo_config.json', 'w') as f:
-                json.dump(config, f)
-        except Exception as e:
-            print(f"Error saving config: {e}")
+        self.refresh_index()
+        if self.watch_repos:
+            self.start_watching()
 
     def create_widgets(self):
         # Create main container with padding
@@ -260,6 +1588,20 @@ class RepoUpdateGUI:
             **setup_button_config
         ).pack(side=tk.LEFT, padx=2)
 
+        tk.Button(
+            btn_frame,
+            text="Index Folder",
+            command=self.add_index_root,
+            **button_config
+        ).pack(side=tk.LEFT, padx=2)
+
+        tk.Button(
+            btn_frame,
+            text="Watch",
+            command=self.toggle_watch,
+            **button_config
+        ).pack(side=tk.LEFT, padx=2)
+
         # Add hover effects
         def on_enter(e):
             if e.widget['bg'] == '#2ea043':  # Green buttons
@@ -287,9 +1629,11 @@ class RepoUpdateGUI:
                     self.recent_repos.pop()
                 self.path_combo['values'] = self.recent_repos
                 self.save_config()
+            self.schedule_preview()
 
         self.path_combo.bind('<<ComboboxSelected>>', on_path_change)
         self.path_combo.bind('<Return>', on_path_change)
+        self.path_combo.bind('<KeyRelease>', self.on_path_typed)
 
         # Text input configuration with different background colors
         text_config_base = {
@@ -431,6 +1775,15 @@ class RepoUpdateGUI:
         )
         issue_check.pack(side=tk.LEFT, padx=5)
 
+        self.tag_release_var = tk.BooleanVar(value=False)
+        release_check = ttk.Checkbutton(
+            bottom_frame,
+            text="Tag Release",
+            variable=self.tag_release_var,
+            style='Custom.TCheckbutton'
+        )
+        release_check.pack(side=tk.LEFT, padx=5)
+
         update_btn = tk.Button(
             bottom_frame,
             text="Update Repository",
@@ -439,6 +1792,30 @@ class RepoUpdateGUI:
         )
         update_btn.pack(side=tk.RIGHT, padx=5)
 
+        bulk_btn = tk.Button(
+            bottom_frame,
+            text="Bulk Update",
+            command=self.bulk_update,
+            **button_config
+        )
+        bulk_btn.pack(side=tk.RIGHT, padx=5)
+
+        preview_btn = tk.Button(
+            bottom_frame,
+            text="Preview",
+            command=self.show_preview,
+            **button_config
+        )
+        preview_btn.pack(side=tk.RIGHT, padx=5)
+
+        undo_btn = tk.Button(
+            bottom_frame,
+            text="Undo",
+            command=self.undo_update,
+            **button_config
+        )
+        undo_btn.pack(side=tk.RIGHT, padx=5)
+
         # Status Label
         self.status_var = tk.StringVar()
         status_label = ttk.Label(
@@ -449,6 +1826,11 @@ class RepoUpdateGUI:
         )
         status_label.grid(row=5, column=0, columnspan=2, pady=10)
 
+        # Re-render the preview as the user types
+        for widget in [self.update_desc, self.known_issues, self.high_priority_todo,
+                       self.normal_priority_todo, self.future_enhancements, self.path_combo]:
+            widget.bind('<KeyRelease>', self.schedule_preview, add='+')
+
         # Adjust frame padding
         for frame in [repo_frame, info_frame, todo_frame, github_frame]:
             frame.configure(padding="1")
@@ -459,6 +1841,207 @@ class RepoUpdateGUI:
         todo_frame.grid(pady=1)
         github_frame.grid(pady=1)
 
+    def on_path_typed(self, event=None):
+        """Debounce typeahead lookups in the repository index"""
+        if event is not None and event.keysym in ('Return', 'Up', 'Down', 'Left', 'Right', 'Escape', 'Tab'):
+            return
+        if self.index_search_job:
+            self.root.after_cancel(self.index_search_job)
+        self.index_search_job = self.root.after(150, self.update_path_suggestions)
+
+    def update_path_suggestions(self):
+        """Fill the path dropdown with the best index matches for the typed text"""
+        self.index_search_job = None
+        query = self.repo_path.get()
+        if not query or os.path.isabs(query) and os.path.isdir(query):
+            self.path_combo['values'] = self.recent_repos
+            return
+        matches = self.repo_index.search(query)
+        self.path_combo['values'] = matches + [r for r in self.recent_repos if r not in matches]
+
+    def add_index_root(self):
+        """Add a folder to scan for repositories"""
+        path = filedialog.askdirectory()
+        if path and path not in self.index_roots:
+            self.index_roots.append(path)
+            self.save_config()
+            self.refresh_index()
+
+    def refresh_index(self):
+        """Load and refresh the repository index in a background thread"""
+        def worker():
+            try:
+                self.repo_index.load()
+                if not self.index_roots:
+                    return
+                count = self.repo_index.refresh(self.index_roots)
+                self.root.after(0, lambda: self.status_var.set(f"Indexed {count} repositories"))
+            except Exception as e:
+                print(f"Error indexing repositories: {e}")
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def start_watching(self, log=None):
+        """Start the watch daemon for all configured repositories"""
+        if self.watch_daemon is None:
+            if log is None:
+                log = lambda message: self.root.after(0, lambda: self.status_var.set(message))
+            self.watch_daemon = self.make_watch_daemon(log)
+            self.watch_daemon.start()
+        elif log is not None:
+            self.watch_daemon.log = log
+        for path in self.watch_repos:
+            self.watch_daemon.watch(path)
+
+    def toggle_watch(self):
+        """Add or remove the current repository from the watch list"""
+        path = self.repo_path.get()
+        if not path:
+            messagebox.showerror("Error", "Please select a repository path first")
+            return
+
+        if path in self.watch_repos:
+            self.watch_repos.remove(path)
+            if self.watch_daemon:
+                self.watch_daemon.unwatch(path)
+            self.status_var.set(f"Stopped watching {path}")
+        else:
+            self.watch_repos.append(path)
+            self.start_watching()
+            self.status_var.set(f"Watching {path} for changes to {', '.join(DocWatchDaemon.WATCHED_FILES)}")
+        self.save_config()
+
+    def show_preview(self):
+        """Open the preview window showing what an update would change"""
+        if self.preview_window and self.preview_window.winfo_exists():
+            self.preview_window.lift()
+        else:
+            self.preview_window = tk.Toplevel(self.root)
+            self.preview_window.title("Update Preview")
+            self.preview_window.geometry("700x500")
+            self.preview_window.configure(bg=self.colors['bg'])
+
+            self.preview_text = tk.Text(
+                self.preview_window,
+                bg=self.colors['secondary_bg'],
+                fg=self.colors['text'],
+                font=('Consolas', 9),
+                relief='flat',
+                wrap='none'
+            )
+            scrollbar = ttk.Scrollbar(self.preview_window, command=self.preview_text.yview)
+            self.preview_text.configure(yscrollcommand=scrollbar.set)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            self.preview_text.pack(fill=tk.BOTH, expand=True)
+            self.preview_text.tag_configure('added', foreground='#3fb950')
+            self.preview_text.tag_configure('removed', foreground=self.colors['error'])
+            self.preview_text.tag_configure('header', foreground='#58a6ff')
+        self.schedule_preview()
+
+    def schedule_preview(self, event=None):
+        """Debounce preview rendering while typing"""
+        if not (self.preview_window and self.preview_window.winfo_exists()):
+            return
+        if self.preview_job:
+            self.root.after_cancel(self.preview_job)
+        self.preview_job = self.root.after(300, self.request_preview)
+
+    def request_preview(self):
+        """Hand the current inputs to the preview worker"""
+        self.preview_job = None
+        inputs = (
+            self.repo_path.get(),
+            self.update_desc.get("1.0", tk.END).strip(),
+            self.known_issues.get("1.0", tk.END).strip(),
+            self.high_priority_todo.get("1.0", tk.END).strip(),
+            self.normal_priority_todo.get("1.0", tk.END).strip(),
+            self.future_enhancements.get("1.0", tk.END).strip(),
+            datetime.now().strftime("%Y-%m-%d")
+        )
+        self.preview_key = hashlib.sha1(json.dumps(inputs).encode('utf-8')).hexdigest()
+        self.preview_queue.put((self.preview_key, inputs))
+
+    def preview_worker(self):
+        """Render previews off the UI thread, always working on the newest request"""
+        while True:
+            key, inputs = self.preview_queue.get()
+            try:
+                while True:
+                    key, inputs = self.preview_queue.get_nowait()
+            except queue.Empty:
+                pass
+
+            try:
+                text = self.render_preview(key, inputs)
+            except Exception as e:
+                text = f"Error rendering preview: {e}"
+            self.root.after(0, lambda key=key, text=text: self.display_preview(key, text))
+
+    def read_cached(self, path):
+        """Read a file, reusing the last read while its mtime and size are unchanged"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self.file_cache.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        content = read_text(path)
+        self.file_cache[path] = (stamp, content)
+        return content
+
+    def render_preview(self, key, inputs):
+        """Return the diff of every file an update would write plus the issue body"""
+        repo_path, update_desc, known_issues, high, normal, future, current_date = inputs
+        readme_path = os.path.join(repo_path, 'README.md')
+        changelog_path = os.path.join(repo_path, 'CHANGELOG.md')
+        notes_path = os.path.join(repo_path, 'UPDATE_NOTES.md')
+        files = [self.read_cached(p) for p in (readme_path, changelog_path, notes_path)]
+
+        # Results depend on the inputs and on the files they're applied to
+        stamps = [self.file_cache.get(p, (None,))[0] if f is not None else None
+                  for p, f in zip((readme_path, changelog_path, notes_path), files)]
+        cache_key = (key, tuple(stamps))
+        if cache_key in self.preview_cache:
+            return self.preview_cache[cache_key]
+
+        readme, changelog, notes = files
+        todo_items = format_todo_items(high, normal, future)
+        repo_name = os.path.basename(os.path.abspath(repo_path)) if repo_path else ''
+        _, issue_body, issue_comments, _ = build_issue(update_desc, known_issues, high, normal, future, current_date)
+
+        parts = [
+            fast_unified_diff(readme or '', render_readme(readme, update_desc, current_date, repo_name), 'README.md'),
+            fast_unified_diff(changelog or '', render_changelog(changelog, update_desc, current_date), 'CHANGELOG.md'),
+            fast_unified_diff(notes or '', render_update_notes(update_desc, known_issues, todo_items, current_date), 'UPDATE_NOTES.md'),
+            "=== GitHub issue body ===\n" + issue_body
+        ] + [f"=== GitHub issue comment {i} ===\n{comment}" for i, comment in enumerate(issue_comments, 1)]
+        text = '\n'.join(part for part in parts if part)
+
+        if len(self.preview_cache) > 32:
+            self.preview_cache.clear()
+        self.preview_cache[cache_key] = text
+        return text
+
+    def display_preview(self, key, text):
+        """Show a rendered preview if it is still the latest one"""
+        if key != self.preview_key or not (self.preview_window and self.preview_window.winfo_exists()):
+            return
+        self.preview_text.configure(state='normal')
+        self.preview_text.delete("1.0", tk.END)
+        for line in text.splitlines(keepends=True):
+            if line.startswith(('+++', '---', '@@', '===')):
+                tag = 'header'
+            elif line.startswith('+'):
+                tag = 'added'
+            elif line.startswith('-'):
+                tag = 'removed'
+            else:
+                tag = ()
+            self.preview_text.insert(tk.END, line, tag)
+        self.preview_text.configure(state='disabled')
+
     def init_repo(self):
         """Initialize a new git repository"""
         path = self.repo_path.get()
@@ -493,6 +2076,7 @@ class RepoUpdateGUI:
                 if len(self.recent_repos) > 5:  # Keep only 5 most recent
                     self.recent_repos.pop()
                 self.save_config()
+            self.schedule_preview()
 
     def save_token(self):
         """Save GitHub token"""
@@ -504,18 +2088,21 @@ class RepoUpdateGUI:
         else:
             messagebox.showerror("Error", "Please enter a GitHub token")
 
-    def create_github_issue(self, repo_path, update_desc, known_issues, todo_items):
-        """Create a GitHub issue for the update"""
+    def create_github_issue(self, repo_path, update_desc, known_issues, high_priority, normal_priority,
+                            future_enhancements):
+        """Create a GitHub issue for the update and return its number, or None on failure
+
+        Runs on the update worker thread, so it only touches Tk through root.after.
+        """
         try:
             if not self.github_token:
                 raise ValueError("GitHub token not configured")
 
-            g = Github(self.github_token)
+            g = Github(self.github_token, base_url=self.github_api_url)
             
             # Extract repository owner and name from remote URL
             repo = git.Repo(repo_path)
-            remote_url = repo.remotes.origin.url
-            owner_repo = remote_url.split('.git')[0].split('github.com/')[-1]
+            owner_repo = owner_repo_from_url(repo.remotes.origin.url)
             
             # Get GitHub repository
             github_repo = g.get_repo(owner_repo)
@@ -523,73 +2110,42 @@ class RepoUpdateGUI:
             # Get current date for the title
             current_date = datetime.now().strftime("%Y-%m-%d")
             
-            # Create a more descriptive title from the description
-            title = f"Update ({current_date}): {update_desc[:50]}..." if len(update_desc) > 50 else f"Update ({current_date}): {update_desc}"
-
-            # Build the issue body with conditional sections
-            body = f"""# Repository Update - {current_date}
-
-## Description
-{update_desc}
-"""
-
-            # Only add Known Issues section if there are any
-            if known_issues.strip():
-                body += f"""
-## Known Issues
-{known_issues}
-"""
-
-            # Add Todo sections only if they contain content
-            high_priority = self.high_priority_todo.get("1.0", tk.END).strip()
-            normal_priority = self.normal_priority_todo.get("1.0", tk.END).strip()
-            future_enhancements = self.future_enhancements.get("1.0", tk.END).strip()
-
-            if any([high_priority, normal_priority, future_enhancements]):
-                body += "\n## Todo Items"
-                
-                if high_priority:
-                    body += f"""
-### 🔴 High Priority
-{high_priority}
-"""
-
-                if normal_priority:
-                    body += f"""
-### 🟡 Normal Priority
-{normal_priority}
-"""
-
-                if future_enhancements:
-                    body += f"""
-### 🔵 Future Enhancements
-{future_enhancements}
-"""
-
-            # Add footer
-            body += """
----
-*This issue was automatically created by the Repository Update Tool*"""
-
-            # Determine labels based on content
-            labels = ['update']
-            if known_issues.strip():
-                labels.append('has-issues')
-            if high_priority:
-                labels.append('high-priority')
-            if future_enhancements:
-                labels.append('enhancement')
+            title, body, comments, labels = build_issue(
+                update_desc,
+                known_issues,
+                high_priority,
+                normal_priority,
+                future_enhancements,
+                current_date
+            )
 
-            # Create the issue with appropriate labels
-            github_repo.create_issue(title=title, body=body, labels=labels)
-            
-            self.status_var.set("Repository updated and GitHub issue created successfully!")
-            return True
+            # Reuse today's open update issue instead of opening a duplicate
+            reader = GitHubReadCache(self.github_token, self.github_cache_dir, self.github_api_url)
+            existing = reader.find_open_issue(owner_repo, f"Update ({current_date})")
+            return self.publish_issue(github_repo, title, body, labels, existing, comments)
             
         except Exception as e:
-            messagebox.showerror("GitHub Error", f"Failed to create issue: {str(e)}")
-            self.status_var.set("Repository updated but failed to create GitHub issue")
-            return False
+            self.root.after(0, lambda message=str(e): messagebox.showerror(
+                "GitHub Error", f"Failed to create issue: {message}"))
+            return None
+
+    def publish_issue(self, github_repo, title, body, labels, existing=None, comments=()):
+        """Create the issue, or comment on an existing one, and return its number"""
+        if existing is None:
+            # Create the issue with appropriate labels
+            issue = github_repo.create_issue(title=title, body=body, labels=labels)
+        else:
+            issue = github_repo.get_issue(existing['number'])
+            issue.create_comment(body)
+            current_labels = {label['name'] for label in existing.get('labels', [])}
+            missing = [label for label in labels if label not in current_labels]
+            if missing:
+                issue.add_to_labels(*missing)
+
+        # Whatever didn't fit in the body follows as comments, in order
+        for comment in comments:
+            issue.create_comment(comment)
+        return issue.number
 
     def update_repository(self):
         repo_path = self.repo_path.get()
@@ -602,107 +2158,171 @@ class RepoUpdateGUI:
         future_enhancements = self.future_enhancements.get("1.0", tk.END).strip()
 
         # Combine todo items with proper formatting
-        todo_items = f"""## High Priority
-{high_priority}
-
-## Normal Priority
-{normal_priority}
-
-## Future Enhancements
-{future_enhancements}"""
+        todo_items = format_todo_items(high_priority, normal_priority, future_enhancements)
 
         if not repo_path or not update_desc:
             messagebox.showerror("Error", "Please provide repository path and update description")
             return
 
-        try:
-            self.status_var.set("Updating repository...")
-            self.root.update()
-
-            # Change to repository directory
-            os.chdir(repo_path)
-            current_date = datetime.now().strftime("%Y-%m-%d")
-
-            # Update README.md
-            self.update_readme(update_desc, current_date)
-
-            # Update CHANGELOG.md
-            self.update_changelog(update_desc, current_date)
-
-            # Create UPDATE_NOTES.md
-            self.create_update_notes(update_desc, known_issues, todo_items, current_date)
-
-            # Git operations
-            repo = git.Repo(repo_path)
-            repo.index.add(['README.md', 'CHANGELOG.md', 'UPDATE_NOTES.md'])
-            commit_message = f"update({current_date}): {update_desc}\n\n- Updated documentation\n- Added changelog entry\n- Created update notes"
-            repo.index.commit(commit_message)
-
-            if self.create_issue_var.get():
-                if self.create_github_issue(repo_path, update_desc, known_issues, todo_items):
-                    self.status_var.set("Repository updated and GitHub issue created!")
-                else:
-                    self.status_var.set("Repository updated but failed to create GitHub issue")
-
-            self.status_var.set("Repository updated successfully!")
+        if self.update_running:
+            return
+        release = self.tag_release_var.get()
+        create_issue = self.create_issue_var.get()
+        self.update_running = True
+        self.status_var.set("Updating repository...")
+
+        def worker():
+            # Hooks and artifact hashing can take minutes; keep the window responsive
+            summary = {}
+
+            def on_hooks(results):
+                summary['hooks'] = HookRunner.summary(results)
+                self.root.after(0, lambda text=summary['hooks']: self.status_var.set(text))
+
+            try:
+                self.commit_doc_update(repo_path, update_desc, known_issues, todo_items,
+                                       on_hooks=on_hooks,
+                                       release=release,
+                                       on_release=lambda tag: summary.update(tag=f"Tagged {tag}"))
+            except Exception as e:
+                self.root.after(0, lambda message=str(e): self.finish_update(
+                    f"Error: {message}", f"An error occurred: {message}"))
+                return
+
+            parts = ["Repository updated successfully!"] + [summary[k] for k in ('hooks', 'tag') if k in summary]
+            if create_issue:
+                number = self.create_github_issue(repo_path, update_desc, known_issues,
+                                                  high_priority, normal_priority, future_enhancements)
+                parts.append(f"GitHub issue #{number} updated" if number else "failed to create GitHub issue")
+            self.root.after(0, lambda: self.finish_update(" | ".join(parts)))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def finish_update(self, status, error=None):
+        """Report the result of update_repository's worker on the UI thread"""
+        self.update_running = False
+        self.status_var.set(status)
+        if error:
+            messagebox.showerror("Error", error)
+        else:
+            # The docs on disk changed, so the old diff is stale
+            self.schedule_preview()
             messagebox.showinfo("Success", "Repository has been updated successfully!")
 
-        except Exception as e:
-            self.status_var.set(f"Error: {str(e)}")
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+    def undo_update(self):
+        """Restore the docs from before the last update"""
+        repo_path = self.repo_path.get()
+        if not repo_path:
+            messagebox.showerror("Error", "Please select a repository path first")
+            return
 
-    def update_readme(self, update_desc, current_date):
-        if not os.path.exists('README.md'):
-            with open('README.md', 'w') as f:
-                f.write(f"# {os.path.basename(os.getcwd())}\n\n## Current Status\n🟢 Active Development\n")
+        answer = messagebox.askyesnocancel(
+            "Undo Update",
+            "Restore README, CHANGELOG and UPDATE_NOTES from before the last update?\n\n"
+            "Yes: also remove the update commit (or revert it if it isn't the latest commit)\n"
+            "No: only restore the files"
+        )
+        if answer is None:
+            return
 
-        with open('README.md', 'r+') as f:
-            content = f.read()
-            if "### Latest Updates" not in content:
-                f.write(f"\n### Latest Updates ({current_date})\n- {update_desc}\n")
+        try:
+            history = HistoryStore.for_repo(repo_path)
+            if not answer:
+                mode = 'files'
             else:
-                # Insert new update at the top of the updates section
-                new_content = content.replace("### Latest Updates", f"### Latest Updates ({current_date})\n- {update_desc}\n")
-                f.seek(0)
-                f.write(new_content)
-                f.truncate()
-
-    def update_changelog(self, update_desc, current_date):
-        if not os.path.exists('CHANGELOG.md'):
-            with open('CHANGELOG.md', 'w') as f:
-                f.write("# Changelog\n\n")
-
-        with open('CHANGELOG.md', 'r+') as f:
-            content = f.read()
-            f.seek(0)
-            f.write(f"## [{current_date}]\n### Added\n- {update_desc}\n\n{content}")
-
-    def create_update_notes(self, update_desc, known_issues, todo_items, current_date):
-        with open('UPDATE_NOTES.md', 'w') as f:
-            f.write(f"""# Update Notes ({current_date})
-
-## Changes Made
-- {update_desc}
-
-## Known Issues
-{known_issues if known_issues else '- [ ] No known issues reported'}
-
-## Todo
-{todo_items if todo_items else '- [ ] No todo items added'}
-
-## Testing Notes
-- [ ] Add testing requirements/results
-
-## Dependencies
-- List any new dependencies added
+                snapshot = history.latest()
+                head = git.Repo(repo_path).head.commit.hexsha
+                mode = 'drop' if snapshot and snapshot['commit'] == head else 'revert'
+            snapshot = history.undo(repo_path, mode)
+            self.status_var.set(f"Undid update {snapshot['commit'][:7]}")
+            self.schedule_preview()
+        except Exception as e:
+            self.status_var.set(f"Error: {str(e)}")
+            messagebox.showerror("Error", f"Failed to undo update: {str(e)}")
 
-## Migration Steps
-1. Pull latest changes
-2. [Add any necessary migration steps]
+    def bulk_update(self):
+        """Stamp the current update into many remotes through the mirror cache"""
+        update_desc = self.update_desc.get("1.0", tk.END).strip()
+        known_issues = self.known_issues.get("1.0", tk.END).strip()
+        high_priority = self.high_priority_todo.get("1.0", tk.END).strip()
+        normal_priority = self.normal_priority_todo.get("1.0", tk.END).strip()
+        future_enhancements = self.future_enhancements.get("1.0", tk.END).strip()
+        todo_items = format_todo_items(high_priority, normal_priority, future_enhancements)
+        create_issues = self.create_issue_var.get()
+        if not update_desc:
+            messagebox.showerror("Error", "Please provide an update description")
+            return
 
-## Rollback Plan
-1. [Document how to rollback these changes if needed]
-""")
+        remotes = simpledialog.askstring(
+            "Bulk Update",
+            "Remote URLs (separated by spaces or commas):",
+            initialvalue=' '.join(self.bulk_remotes)
+        )
+        if not remotes:
+            return
+        self.bulk_remotes = remotes.replace(',', ' ').split()
+        self.save_config()
+
+        current_date = datetime.now().strftime("%Y-%m-%d")
+        remotes = list(self.bulk_remotes)
+
+        def worker():
+            cache = MirrorCache(self.mirror_cache_dir)
+            failed = []
+            updated = []
+            for i, remote_url in enumerate(remotes, 1):
+                self.root.after(0, lambda i=i, u=remote_url: self.status_var.set(f"Updating {i}/{len(remotes)}: {u}"))
+                try:
+                    # The worktree only holds the docs, so lint/test hooks can't run there
+                    cache.stamp(remote_url, lambda path: self.commit_doc_update(
+                        path, update_desc, known_issues, todo_items, current_date, run_hooks=False))
+                    updated.append(remote_url)
+                except Exception as e:
+                    print(f"Error updating {remote_url}: {e}")
+                    failed.append(remote_url)
+
+            issue_failures = 0
+            if create_issues and self.github_token:
+                issue_failures = self.create_bulk_issues(
+                    [u for u in updated if 'github.com' in u],
+                    build_issue(update_desc, known_issues, high_priority, normal_priority,
+                                future_enhancements, current_date),
+                    current_date
+                )
+
+            summary = f"Bulk update finished: {len(updated)} updated, {len(failed)} failed"
+            if issue_failures:
+                summary += f", {issue_failures} issues failed"
+            self.root.after(0, lambda: self.status_var.set(summary))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def create_bulk_issues(self, remote_urls, issue, current_date):
+        """Create or update the update issue in many repos, returning the number of failures"""
+        title, body, comments, labels = issue
+        owner_repos = [owner_repo_from_url(u) for u in remote_urls]
+        try:
+            # One GraphQL query for every repo instead of a REST poll per repo
+            reader = GitHubReadCache(self.github_token, self.github_cache_dir, self.github_api_url)
+            info = reader.lookup_repos(owner_repos, f"Update ({current_date})")
+        except Exception as e:
+            print(f"Error looking up repositories: {e}")
+            return len(owner_repos)
+
+        g = Github(self.github_token, base_url=self.github_api_url)
+        failures = 0
+        for owner_repo in owner_repos:
+            if info[owner_repo]['error']:
+                print(f"Error looking up {owner_repo}: {info[owner_repo]['error']}")
+                failures += 1
+                continue
+            try:
+                self.publish_issue(g.get_repo(owner_repo), title, body, labels,
+                                   info[owner_repo]['existing_issue'], comments)
+            except Exception as e:
+                print(f"Error creating issue in {owner_repo}: {e}")
+                failures += 1
+        return failures
 
     def setup_repository(self):
         """Set up repository with proper structure and .gitignore"""
@@ -836,7 +2456,38 @@ github_config.json
 
         messagebox.showinfo("Success", "Repository setup complete!")
 
+def run_daemon(log_path='gitswift_daemon.log'):
+    """Watch the configured repositories without the GUI until interrupted"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s %(message)s',
+        handlers=[logging.FileHandler(log_path, encoding='utf-8'), logging.StreamHandler()]
+    )
+    updater = DocUpdater()
+    updater.load_config()
+    if not updater.watch_repos:
+        logging.info("No repositories to watch, add some with the Watch button in the GUI")
+        return
+
+    daemon = updater.make_watch_daemon(logging.info)
+    for path in updater.watch_repos:
+        daemon.watch(path)
+    daemon.start()
+    logging.info(f"Watching {len(updater.watch_repos)} repositories, press Ctrl+C to stop")
+    try:
+        while daemon.thread.is_alive():
+            daemon.thread.join(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.stop()
+
 if __name__ == "__main__":
+    if '--daemon' in sys.argv:
+        # Headless: no Tk and the console stays visible, so Ctrl+C stops it
+        run_daemon()
+        sys.exit(0)
+
     # Hide terminal in Windows
     try:
         import win32gui
@@ -850,7 +2501,6 @@ if __name__ == "__main__":
     # Apply system theme
     try:
         from tkinter import ttk
-        import sys
         if sys.platform.startswith('win'):
             root.tk.call('source', 'azure.tcl')
             root.tk.call('set_theme', 'dark')
@@ -1,26 +1,68 @@
 import subprocess
 import sys
 import os
+import time
+import platform
+from importlib import metadata
+
+# (package, install only when this is true)
+REQUIREMENTS = [
+    ('gitpython', True),
+    ('PyGithub', True),
+    ('pywin32', platform.system() == 'Windows')
+]
+
+def missing_requirements():
+    """Return the required packages that aren't installed"""
+    missing = []
+    for package, needed in REQUIREMENTS:
+        if not needed:
+            continue
+        try:
+            metadata.version(package)
+        except metadata.PackageNotFoundError:
+            missing.append(package)
+    return missing
+
+def find_wheelhouse():
+    """Return a local wheel directory to install from, if one is configured"""
+    if '--wheelhouse' in sys.argv:
+        index = sys.argv.index('--wheelhouse')
+        if index + 1 < len(sys.argv):
+            return sys.argv[index + 1]
+    if os.environ.get('GITSWIFT_WHEELHOUSE'):
+        return os.environ['GITSWIFT_WHEELHOUSE']
+    default = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wheelhouse')
+    if os.path.isdir(default):
+        return default
+    return None
 
 def install_requirements():
     """Install all required packages for GitSwift"""
-    requirements = [
-        'gitpython',
-        'PyGithub',
-        'pywin32;platform_system=="Windows"'
-    ]
-
-    print("Installing required packages...")
-    
-    for package in requirements:
-        try:
-            print(f"Installing {package}...")
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-        except subprocess.CalledProcessError as e:
-            print(f"Error installing {package}: {e}")
-            return False
-    
-    print("\nAll requirements installed successfully!")
+    started = time.perf_counter()
+
+    # Checking installed metadata is instant, only start pip when something is missing
+    missing = missing_requirements()
+    if not missing:
+        print(f"All requirements already installed ({time.perf_counter() - started:.2f}s)")
+        return True
+
+    command = [sys.executable, "-m", "pip", "install", *missing]
+    wheelhouse = find_wheelhouse()
+    if wheelhouse:
+        # Offline install from local wheels, no network access
+        command += ["--no-index", "--find-links", wheelhouse]
+        print(f"Installing {', '.join(missing)} from {wheelhouse}...")
+    else:
+        print(f"Installing {', '.join(missing)}...")
+
+    try:
+        subprocess.check_call(command)
+    except subprocess.CalledProcessError as e:
+        print(f"Error installing requirements: {e}")
+        return False
+
+    print(f"\nAll requirements installed successfully! ({time.perf_counter() - started:.1f}s)")
     print("\nYou can now run GitSwift by executing: python GitSwift.py")
     return True
 
@@ -0,0 +1,39 @@
+import os
+import sys
+
+import git
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GitSwift_Update import DocUpdater
+
+
+@pytest.fixture
+def git_identity(monkeypatch):
+    for var in ('GIT_AUTHOR_NAME', 'GIT_COMMITTER_NAME'):
+        monkeypatch.setenv(var, 'GitSwift Test')
+    for var in ('GIT_AUTHOR_EMAIL', 'GIT_COMMITTER_EMAIL'):
+        monkeypatch.setenv(var, 'test@example.com')
+
+
+@pytest.fixture
+def doc_repo(tmp_path, git_identity):
+    """A repository with a CHANGELOG and release artifacts under dist/"""
+    repo = git.Repo.init(tmp_path)
+    (tmp_path / 'CHANGELOG.md').write_text('# Changelog\n', encoding='utf-8')
+    os.makedirs(tmp_path / 'dist' / 'wheels')
+    (tmp_path / 'dist' / 'app.tar.gz').write_bytes(b'artifact')
+    (tmp_path / 'dist' / 'wheels' / 'app.whl').write_bytes(b'wheel')
+    repo.index.add(['CHANGELOG.md'])
+    repo.index.commit('initial')
+    return repo
+
+
+@pytest.fixture
+def updater():
+    updater = DocUpdater()
+    updater.hooks = []
+    updater.hook_workers = 1
+    updater.release_settings = {}
+    return updater
@@ -0,0 +1,113 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from GitSwift_Update import GitHubReadCache
+
+ISSUES = [
+    {'number': 7, 'title': 'Update (2026-10-19): docs', 'labels': []},
+    {'number': 8, 'title': 'Unrelated', 'labels': []}
+]
+
+
+class MockGitHub(BaseHTTPRequestHandler):
+    """Just enough of the REST and GraphQL API for GitHubReadCache"""
+
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, status, body, headers=None):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self.requests.append(('GET', self.path, self.headers.get('If-None-Match')))
+        if self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.send_header('ETag', '"v1"')
+            self.end_headers()
+        else:
+            self._send_json(200, ISSUES, {'ETag': '"v1"'})
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.requests.append(('POST', self.path, payload['variables']))
+        variables = payload['variables']
+        data = {}
+        errors = []
+        i = 0
+        while f'n{i}' in variables:
+            if variables[f'n{i}'] == 'gone':
+                # What GitHub answers for a missing repository
+                data[f'r{i}'] = None
+                errors.append({
+                    'type': 'NOT_FOUND',
+                    'path': [f'r{i}'],
+                    'message': f"Could not resolve to a Repository with the name '{variables[f'o{i}']}/gone'."
+                })
+            else:
+                data[f'r{i}'] = {
+                    'defaultBranchRef': {'name': 'main'},
+                    'labels': {'nodes': [{'name': 'documentation'}]}
+                }
+            data[f's{i}'] = {'nodes': [
+                {'number': 7, 'title': 'Update (2026-10-19): docs', 'labels': {'nodes': [{'name': 'documentation'}]}}
+            ]}
+            i += 1
+        self._send_json(200, {'data': data, 'errors': errors} if errors else {'data': data})
+
+
+@pytest.fixture
+def server():
+    MockGitHub.requests = []
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), MockGitHub)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_address[1]}'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_get_revalidates_with_etag(server, tmp_path):
+    reader = GitHubReadCache('token', str(tmp_path), server)
+
+    assert reader.get('/repos/o/r/issues') == ISSUES
+    assert reader.get('/repos/o/r/issues') == ISSUES
+    assert reader.find_open_issue('o/r', 'Update (2026-10-19)')['number'] == 7
+
+    path = '/repos/o/r/issues?state=open&per_page=100'
+    assert MockGitHub.requests == [
+        ('GET', '/repos/o/r/issues', None),
+        ('GET', '/repos/o/r/issues', '"v1"'),
+        ('GET', path, None)
+    ]
+
+
+def test_lookup_repos_fails_only_the_missing_repo(server, tmp_path):
+    reader = GitHubReadCache('token', str(tmp_path), server)
+
+    info = reader.lookup_repos(['o/good', 'o/gone', 'o/other'], 'Update (2026-10-19)')
+
+    # One batched query for all three repositories
+    assert [r[0] for r in MockGitHub.requests] == ['POST']
+    assert 'Could not resolve' in info['o/gone']['error']
+    for owner_repo in ('o/good', 'o/other'):
+        assert info[owner_repo]['error'] is None
+        assert info[owner_repo]['default_branch'] == 'main'
+        assert info[owner_repo]['labels'] == ['documentation']
+        assert info[owner_repo]['existing_issue'] == {
+            'number': 7,
+            'title': 'Update (2026-10-19): docs',
+            'labels': [{'name': 'documentation'}]
+        }
+
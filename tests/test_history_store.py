@@ -0,0 +1,28 @@
+import os
+
+import pytest
+
+from GitSwift_Update import HistoryStore, HookFailedError
+
+
+@pytest.mark.parametrize('mode, tag_kept', [('files', True), ('revert', False), ('drop', False)])
+def test_undo_only_deletes_tag_when_commit_goes(doc_repo, updater, mode, tag_kept):
+    commit = updater.commit_doc_update(doc_repo.working_dir, 'first', '', '', '2026-10-19', release=True)
+    assert [t.name for t in doc_repo.tags] == ['v2026-10-19']
+
+    snapshot = HistoryStore.for_repo(doc_repo.working_dir).undo(doc_repo.working_dir, mode)
+
+    assert snapshot['commit'] == commit.hexsha
+    assert ('v2026-10-19' in doc_repo.tags) == tag_kept
+    with open(os.path.join(doc_repo.working_dir, 'CHANGELOG.md'), encoding='utf-8') as f:
+        assert f.read() == '# Changelog\n'
+
+
+def test_rolled_back_update_leaves_no_snapshot(doc_repo, updater):
+    updater.hooks = [{'name': 'fail', 'command': 'exit 1'}]
+    with pytest.raises(HookFailedError):
+        updater.commit_doc_update(doc_repo.working_dir, 'rejected', '', '', '2026-10-19')
+
+    history = HistoryStore.for_repo(doc_repo.working_dir)
+    assert os.listdir(history.snapshots_dir) == []
+    assert doc_repo.git.status('--porcelain', '--', 'README.md', 'CHANGELOG.md', 'UPDATE_NOTES.md') == ''
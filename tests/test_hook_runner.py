@@ -0,0 +1,63 @@
+import os
+import time
+
+import git
+import pytest
+
+from GitSwift_Update import HookRunner
+
+
+@pytest.fixture
+def repo(tmp_path, git_identity):
+    repo = git.Repo.init(tmp_path / 'repo')
+    (tmp_path / 'repo' / 'app.py').write_text('bad\n', encoding='utf-8')
+    repo.index.add(['app.py'])
+    repo.index.commit('initial')
+    return repo
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='uses POSIX shell commands')
+def test_timeout_kills_the_whole_command(tmp_path, repo):
+    runner = HookRunner(
+        [{'name': 'slow', 'command': f'sh -c "sleep 1; touch {tmp_path}/finished"', 'timeout': 0.2}],
+        str(tmp_path / 'cache.json')
+    )
+
+    started = time.monotonic()
+    result, = runner.run(repo.working_dir, repo.head.commit.tree.hexsha)
+    assert time.monotonic() - started < 1
+    assert not result['ok']
+    assert result['output'] == 'timed out after 0.2s'
+
+    # The shell's child went down with it
+    time.sleep(1.5)
+    assert not os.path.exists(tmp_path / 'finished')
+
+
+def test_passes_are_cached_by_tree(tmp_path, repo):
+    hooks = [
+        {'name': 'ok', 'command': 'exit 0'},
+        {'name': 'fail', 'command': 'exit 1'}
+    ]
+    runner = HookRunner(hooks, str(tmp_path / 'cache.json'))
+    tree = repo.head.commit.tree.hexsha
+
+    first = runner.run(repo.working_dir, tree)
+    assert [(r['ok'], r['cached']) for r in first] == [(True, False), (False, False)]
+
+    second = runner.run(repo.working_dir, tree)
+    assert [(r['ok'], r['cached']) for r in second] == [(True, True), (False, False)]
+
+    other = runner.run(repo.working_dir, tree, cache_key='other')
+    assert [r['cached'] for r in other] == [False, False]
+
+
+def test_hooks_see_the_tree_not_unstaged_edits(tmp_path, repo):
+    (tmp_path / 'repo' / 'app.py').write_text('ok\n', encoding='utf-8')
+    runner = HookRunner([{'name': 'grep', 'command': 'grep -q ok app.py'}], str(tmp_path / 'cache.json'))
+
+    result, = runner.run(repo.working_dir, repo.head.commit.tree.hexsha)
+
+    assert not result['ok']
+    # The throwaway worktree is gone again
+    assert len(repo.git.worktree('list').splitlines()) == 1
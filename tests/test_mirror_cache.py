@@ -0,0 +1,63 @@
+import os
+
+import git
+import pytest
+
+from GitSwift_Update import MirrorCache
+
+
+pytestmark = pytest.mark.usefixtures('git_identity')
+
+
+@pytest.fixture
+def origin(tmp_path):
+    """A bare origin with docs and some source the stamp shouldn't check out"""
+    origin_path = tmp_path / 'origin.git'
+    git.Repo.init(origin_path, bare=True, initial_branch='main')
+
+    seed = git.Repo.clone_from(str(origin_path), tmp_path / 'seed')
+    (tmp_path / 'seed' / 'README.md').write_text('# seed\n', encoding='utf-8')
+    os.makedirs(tmp_path / 'seed' / 'src')
+    (tmp_path / 'seed' / 'src' / 'app.py').write_text('print("hi")\n', encoding='utf-8')
+    seed.index.add(['README.md', 'src/app.py'])
+    seed.index.commit('initial')
+    seed.git.push('origin', 'HEAD:refs/heads/main')
+    return str(origin_path), seed
+
+
+def test_stamp_pushes_doc_commits_through_sparse_worktree(tmp_path, origin):
+    origin_path, seed = origin
+    cache = MirrorCache(str(tmp_path / 'cache'))
+    seen = []
+
+    def apply_update(path):
+        seen.append(sorted(os.listdir(path)))
+        with open(os.path.join(path, 'CHANGELOG.md'), 'a', encoding='utf-8') as f:
+            f.write(f'- stamp {len(seen)}\n')
+        repo = git.Repo(path)
+        repo.index.add(['CHANGELOG.md'])
+        return repo.index.commit(f'stamp {len(seen)}').hexsha
+
+    first = cache.stamp(origin_path, apply_update)
+
+    # A commit pushed to origin between stamps must be fetched, not overwritten
+    seed.git.pull('origin', 'main')
+    (tmp_path / 'seed' / 'src' / 'app.py').write_text('print("bye")\n', encoding='utf-8')
+    seed.index.add(['src/app.py'])
+    upstream = seed.index.commit('upstream change').hexsha
+    seed.git.push('origin', 'HEAD:refs/heads/main')
+
+    second = cache.stamp(origin_path, apply_update)
+
+    # Only the doc files were checked out
+    assert all('src' not in names for names in seen)
+    assert seen[0] == ['.git', 'README.md']
+
+    origin_repo = git.Repo(origin_path)
+    log = [c.hexsha for c in origin_repo.iter_commits('main')]
+    assert log[:3] == [second, upstream, first]
+    assert origin_repo.git.show('main:CHANGELOG.md') == '- stamp 1\n- stamp 2'
+    assert origin_repo.git.show('main:src/app.py') == 'print("bye")'
+
+    # The throwaway worktrees are gone, only the mirror stays cached
+    assert len(os.listdir(tmp_path / 'cache')) == 1
@@ -0,0 +1,36 @@
+import hashlib
+import os
+import shutil
+import subprocess
+
+import git
+import pytest
+
+from GitSwift_Update import HistoryStore
+
+
+def test_checksums_are_relative_to_the_repo_root(doc_repo, updater):
+    updater.commit_doc_update(doc_repo.working_dir, 'release', '', '', '2026-10-19', release=True)
+
+    with open(os.path.join(doc_repo.working_dir, 'SHA256SUMS'), encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    assert lines == [
+        f"{hashlib.sha256(b'artifact').hexdigest()}  dist/app.tar.gz",
+        f"{hashlib.sha256(b'wheel').hexdigest()}  dist/wheels/app.whl"
+    ]
+    if shutil.which('sha256sum'):
+        subprocess.run(['sha256sum', '-c', '--quiet', 'SHA256SUMS'], cwd=doc_repo.working_dir, check=True)
+
+
+def test_commit_is_recorded_when_tagging_fails(doc_repo, updater, monkeypatch):
+    def tag_release(*args):
+        raise git.exc.GitCommandError('tag', 128)
+    monkeypatch.setattr(updater, 'tag_release', tag_release)
+
+    with pytest.raises(git.exc.GitCommandError):
+        updater.commit_doc_update(doc_repo.working_dir, 'release', '', '', '2026-10-19', release=True)
+
+    history = HistoryStore.for_repo(doc_repo.working_dir)
+    assert history.latest()['commit'] == doc_repo.head.commit.hexsha
+    history.undo(doc_repo.working_dir, 'drop')
+    assert doc_repo.head.commit.message == 'initial'